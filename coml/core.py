@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import random
 import re
@@ -98,6 +99,20 @@ def parse_code(response: str) -> str:
     return response
 
 
+def parse_partial_code(response: str) -> str:
+    """Best-effort code extraction from an incomplete (still streaming) response.
+
+    Returns an empty string until the opening fence line is complete, so that
+    the text preceding the code is never shown as code. Unlike :func:`parse_code`,
+    this never warns, as the closing fence is usually not there yet.
+    """
+    match = re.search(r"```.*\n([\s\S]*?)(?:\n?```|$)", response)
+    if match is not None:
+        # The closing fence may be only partially streamed (e.g., "``").
+        return re.sub(r"\n?`{1,2}$", "", match.group(1))
+    return ""
+
+
 class CoMLAgent:
     """
     CoML agent that accepts data science requests and generates code.
@@ -189,11 +204,19 @@ class CoMLAgent:
 
         return messages
 
-    def _ensemble_generate(self, messages: list[BaseMessage]) -> BaseMessage:
-        """Ensemble the result from multiple LLM calls."""
+    def _ensemble_generate(
+        self,
+        messages: list[BaseMessage],
+        on_partial_response: Callable[[str], None] | None = None,
+    ) -> BaseMessage:
+        """Ensemble the result from multiple LLM calls.
+
+        Ensembling relies on logprobs of complete responses, so partial responses
+        are only streamed when ensemble is disabled.
+        """
 
         if not self.ensemble:
-            return self._generate(messages)
+            return self._generate(messages, on_partial_response)
 
         results: list[tuple[float, BaseMessage]] = []
         for _ in range(self.ensemble):
@@ -252,10 +275,24 @@ class CoMLAgent:
 
         return results[0][1]
 
-    def _generate(self, messages: list[BaseMessage]) -> BaseMessage:
-        """Generate a response from the LLM."""
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        on_partial_response: Callable[[str], None] | None = None,
+    ) -> BaseMessage:
+        """Generate a response from the LLM.
+
+        If ``on_partial_response`` is given, the response is streamed and the
+        callback receives the accumulated response text after every chunk.
+        """
         messages = self._pre_generation(messages)
-        return self.llm.invoke(messages)
+        if on_partial_response is None:
+            return self.llm.invoke(messages)
+        content = ""
+        for chunk in self.llm.stream(messages):
+            content += cast(str, chunk.content)
+            on_partial_response(content)
+        return AIMessage(content=content)
 
     def _select_examples(self, query: str, fewshots: list[_Type]) -> list[_Type]:
         """Select examples from the fewshots."""
@@ -285,6 +322,7 @@ class CoMLAgent:
         request: str,
         variable_descriptions: dict[str, str],
         codes: list[str],
+        on_partial_response: Callable[[str], None] | None = None,
     ) -> GenerateContext:
         fewshots = cached_generate_fewshots(self.prompt_version)
         messages: list[BaseMessage] = []
@@ -327,7 +365,7 @@ class CoMLAgent:
 
         debug_messages(*messages)
 
-        response = self._ensemble_generate(messages)
+        response = self._ensemble_generate(messages, on_partial_response)
         debug_messages(response)
 
         if not isinstance(response.content, str):
@@ -341,6 +379,7 @@ class CoMLAgent:
         output: str | None,
         hint: str | None,
         prev_context: GenerateContext | FixContext,
+        on_partial_response: Callable[[str], None] | None = None,
     ) -> FixContext | None:
         fewshots = cached_fix_fewshots()
         fewshots = self._select_examples(prev_context["request"] or "N/A", fewshots)
@@ -360,7 +399,7 @@ class CoMLAgent:
 
         debug_messages(*messages)
 
-        response = self._ensemble_generate(messages)
+        response = self._ensemble_generate(messages, on_partial_response)
         debug_messages(response)
         explanation, observation, code = parse_fix(response.content)
         if "THE CODE IS CORRECT." in observation:
@@ -396,50 +435,43 @@ class CoMLAgent:
 
         return suggestions
 
-    def explain(self, code: str) -> str:
+    def explain(
+        self, code: str, on_partial_response: Callable[[str], None] | None = None
+    ) -> str:
         messages = [
             SystemMessage(content=EXPLAIN_INSTRUCTION),
             HumanMessage(content=code),
         ]
         debug_messages(*messages)
-        response = self._generate(messages)
+        response = self._generate(messages, on_partial_response)
         debug_messages(response)
         return response.content
 
-    def static_check(
+    def _static_check_messages(
         self, code: str, context: GenerateContext | FixContext
-    ) -> tuple[bool | None, str]:
+    ) -> list[BaseMessage]:
         # Check the quality of code by looking at it (i.e., rubberduck)
-        messages = [
+        return [
             SystemMessage(content=CHECK_INSTRUCTION),
             HumanMessage(content=render_check_context(code, context)),
         ]
-        debug_messages(*messages)
-        response = self._generate(messages)
-        debug_messages(response)
-        reason, last_line = response.content.rstrip().rsplit("\n", 1)
-        if "INCORRECT" in last_line.upper():
-            return False, reason
-        if "CORRECT" in last_line.upper():
-            return True, reason
-        return None, response.content
 
-    def output_sanity_check(
+    def _output_sanity_check_messages(
         self,
         code: str,
         context: GenerateContext | FixContext,
         error: str | None,
         output: str | None,
-    ) -> tuple[bool | None, str]:
+    ) -> list[BaseMessage]:
         # Run a sanity check of the output of the code
-        messages = [
+        return [
             SystemMessage(content=SANITY_CHECK_INSTRUCTION),
             HumanMessage(
                 content=render_sanity_check_context(code, context, error, output)
             ),
         ]
-        debug_messages(*messages)
-        response = self._generate(messages)
+
+    def _parse_check(self, response: BaseMessage) -> tuple[bool | None, str]:
         debug_messages(response)
         reason, last_line = response.content.rstrip().rsplit("\n", 1)
         if "INCORRECT" in last_line.upper():
@@ -448,6 +480,47 @@ class CoMLAgent:
             return True, reason
         return None, response.content
 
+    async def _agenerate(self, messages: list[BaseMessage]) -> BaseMessage:
+        """Generate a response from the LLM asynchronously."""
+        messages = self._pre_generation(messages)
+        return await self.llm.ainvoke(messages)
+
+    def static_check(
+        self, code: str, context: GenerateContext | FixContext
+    ) -> tuple[bool | None, str]:
+        messages = self._static_check_messages(code, context)
+        debug_messages(*messages)
+        return self._parse_check(self._generate(messages))
+
+    async def astatic_check(
+        self, code: str, context: GenerateContext | FixContext
+    ) -> tuple[bool | None, str]:
+        messages = self._static_check_messages(code, context)
+        debug_messages(*messages)
+        return self._parse_check(await self._agenerate(messages))
+
+    def output_sanity_check(
+        self,
+        code: str,
+        context: GenerateContext | FixContext,
+        error: str | None,
+        output: str | None,
+    ) -> tuple[bool | None, str]:
+        messages = self._output_sanity_check_messages(code, context, error, output)
+        debug_messages(*messages)
+        return self._parse_check(self._generate(messages))
+
+    async def aoutput_sanity_check(
+        self,
+        code: str,
+        context: GenerateContext | FixContext,
+        error: str | None,
+        output: str | None,
+    ) -> tuple[bool | None, str]:
+        messages = self._output_sanity_check_messages(code, context, error, output)
+        debug_messages(*messages)
+        return self._parse_check(await self._agenerate(messages))
+
     def visualization_check(
         self,
         request: str,
@@ -476,3 +549,59 @@ class CoMLAgent:
             rationale = verification["rationale"]
             reason.append((answer, aspect + ": " + rationale))
         return pass_verify, reason
+
+    async def batch_check(
+        self,
+        code: str,
+        context: GenerateContext | FixContext,
+        error: str | None = None,
+        output: str | None = None,
+    ) -> tuple[
+        tuple[bool | None, str] | Exception, tuple[bool | None, str] | Exception | None
+    ]:
+        """Run the static check and the output sanity check concurrently,
+        through one ``abatch`` call (one request per check).
+
+        The output sanity check is skipped (returned as None) if there is neither
+        error nor output. A check that fails is returned as its exception, so
+        that it does not discard the result of the other one.
+        """
+        batch = [self._static_check_messages(code, context)]
+        if error or output:
+            batch.append(
+                self._output_sanity_check_messages(code, context, error, output)
+            )
+        batch = [self._pre_generation(messages) for messages in batch]
+        for messages in batch:
+            debug_messages(*messages)
+        responses = await self.llm.abatch(batch, return_exceptions=True)
+        results: list[tuple[bool | None, str] | Exception] = []
+        for response in responses:
+            if isinstance(response, Exception):
+                results.append(response)
+                continue
+            try:
+                results.append(self._parse_check(response))
+            except Exception as e:
+                results.append(e)
+        return results[0], (results[1] if len(results) > 1 else None)
+
+    async def avisualization_check(
+        self,
+        request: str,
+        previous_code: str,
+        svg_string: str,
+        variable_descriptions: dict[str, str],
+        source,
+    ) -> tuple[bool | None, list[tuple[bool | None, str]]]:
+        # The visualization verifier chains several synchronous LLM calls.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self.visualization_check,
+            request,
+            previous_code,
+            svg_string,
+            variable_descriptions,
+            source,
+        )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import re
 import sys
-from typing import Any
+from traceback import print_exception
+from typing import Any, Coroutine
 
 from IPython.core.display import Javascript
 from IPython.core.interactiveshell import InteractiveShell
@@ -208,3 +210,35 @@ def parse_cell_outputs(outputs: list[dict]) -> tuple[str | None, str | None]:
                 output = "<image/svg+xml>"
                 output += cell_out["data"]["image/svg+xml"]
     return error, output
+
+
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine from synchronous code (e.g., a magic).
+
+    Inside ipykernel, an event loop is already running and cannot be blocked on.
+    The coroutine is then scheduled on that loop and the future is returned.
+    Its displays still go to the current cell.
+
+    Otherwise, the coroutine runs to completion on a loop that is reused across
+    calls, so that async HTTP connections bound to it stay usable.
+    """
+    global _event_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        if _event_loop is None or _event_loop.is_closed():
+            _event_loop = asyncio.new_event_loop()
+        return _event_loop.run_until_complete(coro)
+    future = asyncio.ensure_future(coro, loop=loop)
+    future.add_done_callback(_print_future_exception)
+    return future
+
+
+def _print_future_exception(future: asyncio.Future) -> None:
+    if future.cancelled() or future.exception() is None:
+        return
+    exc = future.exception()
+    print_exception(type(exc), exc, exc.__traceback__)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import html
+import re
 import warnings
-from typing import Any
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Callable
 
-import ipywidgets as widgets
-import markdown
 from IPython.core.magic import (
     Magics,
     cell_magic,
@@ -13,19 +16,19 @@ from IPython.core.magic import (
     magics_class,
     no_var_expand,
 )
-from IPython.display import HTML, Code, clear_output, display
-from langchain_community.chat_models import ChatOllama
+from IPython.display import HTML, Code, DisplayHandle, display
 
-from .core import CoMLAgent
+from .core import CoMLAgent, parse_partial_code
 from .ipython_utils import (
     get_ipython_history,
     get_last_cell,
     insert_cell_below,
     parse_cell_outputs,
     run_code_in_next_cell,
+    run_coroutine,
     update_running_cell_metadata,
 )
-from .linter import lint
+from .linter import LinterResult, lint
 from .prompt_utils import (
     FixContext,
     GenerateContext,
@@ -34,6 +37,12 @@ from .prompt_utils import (
     filter_variables,
 )
 
+if TYPE_CHECKING:
+    # Heavy imports are deferred to first use to keep `%load_ext coml` fast.
+    import ipywidgets as widgets
+    import markdown
+    from langchain_ollama import ChatOllama
+
 VERIFY_STYLE = """
 <style>
 summary {
@@ -66,88 +75,260 @@ details :last-child {
 </style>
 """
 
-VERIFY_STATUS_ICON = {
-    "error": "❌",
-    "warning": "⚠️",
-    "info": "ℹ️",
-    "ok": "✅",
-    None: "❔",
-    True: "✅",
-    False: "❌",
-}
+_INLINE_CODE = re.compile(r"`([^`\n]+)`")
+# Block-level syntax (headings, lists, quotes, fences), emphasis and links.
+_MARKDOWN_SYNTAX = re.compile(
+    r"^\s*(#|[-*+]\s|\d+\.\s|>)|```|\*|__|\[[^\]\n]*\]\(", re.MULTILINE
+)
 
 
-@magics_class
-class CoMLMagics(Magics):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+class VerifyStatus(IntEnum):
+    OK = 0
+    WARNING = 1
+    ERROR = 2
+    INFO = 3
+    UNKNOWN = 4
 
-        import dotenv
+
+# Indexed by VerifyStatus.
+VERIFY_STATUS_ICON = ("✅", "⚠️", "❌", "ℹ️", "❔")
+
+
+def _verify_status(result: LinterResult | bool | None) -> VerifyStatus:
+    """Normalize the result of a linter or an LLM check."""
+    if result is None:
+        return VerifyStatus.UNKNOWN
+    if isinstance(result, bool):
+        return VerifyStatus.OK if result else VerifyStatus.ERROR
+    return VerifyStatus[result.upper()]
+
+
+_llm: ChatOllama | None = None
+
+
+def _get_llm() -> ChatOllama:
+    """Build the LLM from the environment (or ``.env``) once per kernel,
+    so that reloading the extension reuses the client."""
+    global _llm
+    if _llm is None:
         import os
 
+        import dotenv
+        from langchain_ollama import ChatOllama
+
+        from .ollama import parse_keep_alive, warn_unquantized_model
+
         dotenv.load_dotenv()
-        headers = {
-            "Authorization": f"Bearer {os.getenv('OLLAMA_API_KEY')}"
-        }
-        llm = ChatOllama(
+        warn_unquantized_model(os.getenv("OLLAMA_MODEL"))
+        headers = {"Authorization": f"Bearer {os.getenv('OLLAMA_API_KEY')}"}
+        _llm = ChatOllama(
             temperature=0.0,
-            headers=headers,
+            # The Ollama clients are kept by the model, so connections are
+            # reused across calls, both sync and async.
+            client_kwargs={"headers": headers},
             model=os.getenv("OLLAMA_MODEL"),
-            base_url=os.getenv("OLLAMA_API_BASE_URL")
+            base_url=os.getenv("OLLAMA_API_BASE_URL"),
+            # The default context window (2048) silently truncates long notebooks.
+            num_ctx=int(os.getenv("OLLAMA_NUM_CTX", "8192")),
+            num_predict=(
+                int(os.environ["OLLAMA_NUM_PREDICT"])
+                if os.getenv("OLLAMA_NUM_PREDICT")
+                else None
+            ),
+            # Keep the model loaded between magics to avoid reloading it.
+            keep_alive=parse_keep_alive(os.getenv("OLLAMA_KEEP_ALIVE", "30m")),
         )
-        self.agent = CoMLAgent(llm)
+    return _llm
+
+
+_button_layout: widgets.Layout | None = None
+
+
+def _get_button_layout() -> widgets.Layout:
+    """Layout shared by the action buttons (four per row)."""
+    global _button_layout
+    if _button_layout is None:
+        import ipywidgets as widgets
+
+        _button_layout = widgets.Layout(width="24.5%")
+    return _button_layout
+
+
+_markdown: markdown.Markdown | None = None
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Markdown converter shared by all the check details."""
+    global _markdown
+    if _markdown is None:
+        import markdown
+
+        _markdown = markdown.Markdown(extensions=["nl2br"])
+    return _markdown
+
+
+def _details_to_html(details: str) -> str:
+    """Render check details as HTML.
+
+    Most details (e.g., PyLint messages) are plain lines, for which escaping
+    and inline code are enough. The full Markdown parser is only used when
+    the details contain other Markdown syntax.
+    """
+    if _MARKDOWN_SYNTAX.search(details) is None:
+        escaped = _INLINE_CODE.sub(r"<code>\1</code>", html.escape(details))
+        return escaped.replace("\n", "<br />\n")
+    return _get_markdown().reset().convert(details)
+
+
+@magics_class
+class CoMLMagics(Magics):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.agent = CoMLAgent(_get_llm())
+
+        # Contexts only change when a new cell is executed,
+        # so they are cached by execution count.
+        self._variable_context_cache: dict[int, dict[str, Any]] = {}
+        self._code_context_cache: dict[int, list[str]] = {}
+        self._joined_code_context_cache: dict[int, str] = {}
+
+        # Static check started right after generation, with the checked code.
+        self._prefetched_static_check: tuple[str, asyncio.Future] | None = None
 
     def _get_variable_context(self) -> dict[str, Any]:
         assert self.shell is not None
-        return {
-            key: describe_variable(value)
-            for key, value in filter_variables(self.shell.user_ns).items()
-        }
+        execution_count = self.shell.execution_count
+        if execution_count not in self._variable_context_cache:
+            self._variable_context_cache = {
+                execution_count: {
+                    key: describe_variable(value)
+                    for key, value in filter_variables(self.shell.user_ns).items()
+                }
+            }
+        return self._variable_context_cache[execution_count]
 
     def _get_code_context(self) -> list[str]:
         assert self.shell is not None
-        return get_ipython_history(self.shell)
+        execution_count = self.shell.execution_count
+        if execution_count not in self._code_context_cache:
+            self._code_context_cache = {
+                execution_count: get_ipython_history(self.shell)
+            }
+        return self._code_context_cache[execution_count]
 
-    def _post_generation(
+    def _get_joined_code_context(self) -> str:
+        assert self.shell is not None
+        execution_count = self.shell.execution_count
+        if execution_count not in self._joined_code_context_cache:
+            self._joined_code_context_cache = {
+                execution_count: "\n".join(self._get_code_context())
+            }
+        return self._joined_code_context_cache[execution_count]
+
+    def _streaming_display(
+        self, language: str = "python"
+    ) -> tuple[DisplayHandle, Callable[[str], None]]:
+        """Create an empty code display, and a callback that refreshes it
+        with the partial LLM response as tokens arrive."""
+        handle = display(Code("", language=language), display_id=True)
+
+        def on_partial_response(response: str) -> None:
+            if language == "python":
+                response = parse_partial_code(response)
+                if not response:
+                    # The code has not started yet.
+                    return
+            handle.update(Code(response, language=language))
+
+        return handle, on_partial_response
+
+    def _prefetch_static_check(
         self, code: str, context: GenerateContext | FixContext
     ) -> None:
-        def run_button_on_click(b):
-            run_code_in_next_cell("%%comlrun\n" + code, {"action": "run", **context})
+        """Start the static check of the generated code in the background,
+        so that it overlaps with the user deciding whether to verify."""
+        if self._prefetched_static_check is not None:
+            # The previous generation was never verified.
+            self._prefetched_static_check[1].cancel()
+            self._prefetched_static_check = None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to run the check in the background.
+            return
+        future = asyncio.ensure_future(self.agent.astatic_check(code, context))
+        # Retrieve the exception so that an unused failed check is not reported.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._prefetched_static_check = (code, future)
 
-        def edit_button_on_click(b):
-            insert_cell_below(code, context)
+    def _pop_prefetched_static_check(self, code: str) -> asyncio.Future | None:
+        if self._prefetched_static_check is None:
+            return None
+        prefetched_code, future = self._prefetched_static_check
+        if prefetched_code != code:
+            return None
+        self._prefetched_static_check = None
+        if future.cancelled() or future.get_loop() is not asyncio.get_running_loop():
+            return None
+        return future
 
-        def explain_button_on_click(b):
-            run_code_in_next_cell("%%comlexplain\n" + code)
+    # Button callbacks. The last argument is the clicked button.
 
-        def verify_button_on_click(b):
-            run_code_in_next_cell("%comlverify")
+    def _on_run_click(self, code: str, context: GenerateContext | FixContext, b):
+        run_code_in_next_cell("%%comlrun\n" + code, {"action": "run", **context})
 
-        run_button = widgets.Button(
-            description="👍 Run it!", layout=widgets.Layout(width="24.5%")
-        )
-        edit_button = widgets.Button(
-            description="🤔 Let me edit.", layout=widgets.Layout(width="24.5%")
-        )
-        explain_button = widgets.Button(
-            description="🧐 Explain it.", layout=widgets.Layout(width="24.5%")
-        )
-        verify_button = widgets.Button(
-            description="🔍 Check yourself.", layout=widgets.Layout(width="24.5%")
-        )
-        run_button.on_click(run_button_on_click)
-        edit_button.on_click(edit_button_on_click)
-        explain_button.on_click(explain_button_on_click)
-        verify_button.on_click(verify_button_on_click)
+    def _on_edit_click(self, code: str, context: GenerateContext | FixContext, b):
+        insert_cell_below(code, context)
+
+    def _on_explain_click(self, code: str, b):
+        run_code_in_next_cell("%%comlexplain\n" + code)
+
+    def _on_verify_click(self, b):
+        run_code_in_next_cell("%comlverify")
+
+    def _on_suggestion_click(self, b):
+        run_code_in_next_cell(r"%coml " + b.description)
+
+    def _on_like_click(self, b):
+        print("Thanks for your feedback! 🤗")
+
+    def _on_retry_click(self, b):
+        run_code_in_next_cell(r"%comlfix")
+
+    def _on_comment_click(self, b):
+        insert_cell_below(r"%comlfix <describe the problem here>")
+
+    def _post_generation(
+        self,
+        code: str,
+        context: GenerateContext | FixContext,
+        handle: DisplayHandle | None = None,
+    ) -> None:
+        import ipywidgets as widgets
+
+        layout = _get_button_layout()
+        run_button = widgets.Button(description="👍 Run it!", layout=layout)
+        edit_button = widgets.Button(description="🤔 Let me edit.", layout=layout)
+        explain_button = widgets.Button(description="🧐 Explain it.", layout=layout)
+        verify_button = widgets.Button(description="🔍 Check yourself.", layout=layout)
+        run_button.on_click(functools.partial(self._on_run_click, code, context))
+        edit_button.on_click(functools.partial(self._on_edit_click, code, context))
+        explain_button.on_click(functools.partial(self._on_explain_click, code))
+        verify_button.on_click(self._on_verify_click)
 
         update_running_cell_metadata({"action": "generate", **context})
 
         combined = widgets.HBox(
             [run_button, edit_button, explain_button, verify_button]
         )
-        display(Code(code, language="python"))
+        if handle is None:
+            display(Code(code, language="python"))
+        else:
+            handle.update(Code(code, language="python"))
         display(combined)
 
+        self._prefetch_static_check(code, context)
+
     def _fix_context_from_cell(self, source: str, **kwargs: Any) -> FixContext:
         return FixContext(
             variables=self._get_variable_context(),
@@ -163,10 +344,16 @@ class CoMLMagics(Magics):
         request: str = line
         if cell is not None:
             request += "\n" + cell
+        handle, on_partial_response = self._streaming_display()
         generate_context = self.agent.generate_code(
-            request.strip(), self._get_variable_context(), self._get_code_context()
+            request.strip(),
+            self._get_variable_context(),
+            self._get_code_context(),
+            on_partial_response=on_partial_response,
+        )
+        return self._post_generation(
+            generate_context["answer"], generate_context, handle
         )
-        return self._post_generation(generate_context["answer"], generate_context)
 
     @no_var_expand
     @line_magic
@@ -187,19 +374,18 @@ class CoMLMagics(Magics):
     @no_var_expand
     @line_magic
     def comlinspire(self, line):
+        import ipywidgets as widgets
+
         if line:
             warnings.warn(r"The argument of %comlinspire is ignored.")
         suggestions = self.agent.suggest(self._get_code_context())
 
-        def run_button_on_click(b):
-            run_code_in_next_cell(r"%coml " + b.description)
-
         buttons = [
             widgets.Button(description=s, layout=widgets.Layout(width="100%"))
             for s in suggestions
         ]
         for button in buttons:
-            button.on_click(run_button_on_click)
+            button.on_click(self._on_suggestion_click)
         display(widgets.VBox(buttons))
 
     @no_var_expand
@@ -233,12 +419,17 @@ class CoMLMagics(Magics):
                 ],
             )
 
-        fix_context = self.agent.fix_code(error, output, hint, context)
+        handle, on_partial_response = self._streaming_display()
+        fix_context = self.agent.fix_code(
+            error, output, hint, context, on_partial_response=on_partial_response
+        )
         if fix_context is None:
+            # Nothing to fix. Drop whatever was streamed.
+            handle.update(Code("", language="python"))
             return
         assert "code" in fix_context["interactions"][-1]
         return self._post_generation(
-            fix_context["interactions"][-1]["code"], fix_context
+            fix_context["interactions"][-1]["code"], fix_context, handle
         )
 
     @no_var_expand
@@ -246,8 +437,140 @@ class CoMLMagics(Magics):
     def comlexplain(self, line, cell):
         if line:
             warnings.warn(r"The argument of %%comlexplain is ignored.")
-        explanation = self.agent.explain(cell)
-        display(Code(explanation, language="markdown"))
+        handle, on_partial_response = self._streaming_display("markdown")
+        explanation = self.agent.explain(cell, on_partial_response=on_partial_response)
+        handle.update(Code(explanation, language="markdown"))
+
+    async def _averify(
+        self,
+        code: str,
+        context: GenerateContext | FixContext,
+        previous_code: str,
+        error: str | None,
+        output: str | None,
+        generated_vis: bool,
+        on_update: Callable[[str, dict[str, Any]], None],
+    ) -> dict[str, Any]:
+        """Run all the checks concurrently.
+
+        Every check pushes its status to a queue as soon as it finishes, and
+        ``on_update`` is called with the name and status of that check.
+
+        ``previous_code`` is the code history, read by the caller. Inside
+        ipykernel, this coroutine runs after the magic has returned, when the
+        execution count already belongs to the next cell.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue()
+        result: dict[str, Any] = {}
+        reported: set[str] = set()
+
+        async def consume():
+            while (item := await queue.get()) is not None:
+                name, status = item
+                result[name] = status
+                on_update(name, status)
+
+        async def report(name: str, check_result: Any, details: str):
+            reported.add(name)
+            await queue.put(
+                (name, {"result": _verify_status(check_result), "details": details})
+            )
+
+        async def check_lint():
+            lint_result, lint_details = await loop.run_in_executor(
+                None, lint, previous_code, code
+            )
+            await report("lint", lint_result, lint_details)
+
+        async def check_code(with_output: bool):
+            error_, output_ = (error, output) if with_output else (None, None)
+            prefetched = self._pop_prefetched_static_check(code)
+            if prefetched is not None:
+                # A failed prefetch (e.g., a transient HTTP error) is not reused.
+                await asyncio.wait([prefetched])
+                if prefetched.exception() is not None:
+                    prefetched = None
+            if prefetched is None:
+                checked = await self.agent.batch_check(code, context, error_, output_)
+                # Report what succeeded; the failed rows are marked by the caller.
+                failures = []
+                for name, check_result in zip(["rubberduck", "sanity"], checked):
+                    if isinstance(check_result, Exception):
+                        failures.append(check_result)
+                    elif check_result is not None:
+                        await report(name, *check_result)
+                if failures:
+                    raise failures[0]
+                return
+
+            # The static check was prefetched. Only the sanity check is left.
+            sanity_future = None
+            if error_ or output_:
+                sanity_future = asyncio.ensure_future(
+                    self.agent.aoutput_sanity_check(code, context, error_, output_)
+                )
+            await report("rubberduck", *prefetched.result())
+            if sanity_future is not None:
+                await report("sanity", *await sanity_future)
+
+        async def check_vis():
+            # Roughly judge the source of the visualization
+            if "plt.show()" not in code:
+                return
+            vis_framework = "matplotlib"
+            (
+                visualization_check_result,
+                visualization_check_details,
+            ) = await self.agent.avisualization_check(
+                context["request"],
+                "\n".join(context["codes"]),
+                output.replace("<image/svg+xml>", ""),
+                context["variables"],
+                vis_framework,
+            )
+            details = "".join(
+                f"{VERIFY_STATUS_ICON[_verify_status(answer)]} {reason}\n"
+                for answer, reason in visualization_check_details
+            )
+            await report("vis", visualization_check_result, details)
+
+        # Rubberduck and output sanity check are sent together, as two concurrent
+        # requests, unless the static check has been prefetched.
+        # Each check is listed with the names of the rows it reports.
+        code_check_names = ["rubberduck"]
+        if not generated_vis and (error or output):
+            code_check_names.append("sanity")
+        checks = [
+            (["lint"], check_lint()),
+            (code_check_names, check_code(with_output=not generated_vis)),
+        ]
+        if generated_vis:
+            checks.append((["vis"], check_vis()))
+
+        consumer = asyncio.ensure_future(consume())
+        exceptions: list[BaseException] = []
+        try:
+            # A failing check must not stop the others from reporting.
+            outcomes = await asyncio.gather(
+                *(check for _, check in checks), return_exceptions=True
+            )
+            for (names, _), outcome in zip(checks, outcomes):
+                if not isinstance(outcome, BaseException):
+                    continue
+                exceptions.append(outcome)
+                details = f"The check failed: {type(outcome).__name__}: {outcome}"
+                for name in names:
+                    if name not in reported:
+                        await queue.put(
+                            (name, {"result": VerifyStatus.ERROR, "details": details})
+                        )
+        finally:
+            await queue.put(None)
+            await consumer
+        if exceptions:
+            raise exceptions[0]
+        return result
 
     @no_var_expand
     @line_magic
@@ -272,88 +595,51 @@ class CoMLMagics(Magics):
             error, output = parse_cell_outputs(target_cell["outputs"])
             generated_vis = output and "<image/svg+xml>" in output
 
-        def display_statuses(statuses):
-            clear_output(wait=True)
-            html = VERIFY_STYLE + "\n"
-            display_names = {
-                "lint": "PyLint",
-                "rubberduck": "Rubberduck",
-            }
-            if generated_vis:
-                display_names["vis"] = "Visualization check"
-            elif error or output:
-                display_names["sanity"] = "Output sanity check"
-
-            loading = "<span class='loader'></span>"
-            message_template = "<details><summary><b>{}:</b> {}</summary>\n{}</details>"
-            for name in display_names:
-                detail_message = "Still loading..."
-                if name in statuses:
-                    detail_message = markdown.markdown(
-                        statuses[name]["details"], extensions=["nl2br"]
-                    )
-                html += message_template.format(
-                    display_names[name],
-                    (
-                        loading
-                        if name not in statuses
-                        else VERIFY_STATUS_ICON[statuses[name]["result"]]
-                    ),
-                    detail_message,
-                )
-
-            display(HTML(html))
-
-        result = {}
-        display_statuses(result)
-
-        lint_result, lint_details = lint("\n".join(self._get_code_context()), code)
-        result["lint"] = {
-            "result": lint_result,
-            "details": lint_details,
+        display_names = {
+            "lint": "PyLint",
+            "rubberduck": "Rubberduck",
         }
-        display_statuses(result)
-
-        rubberduck_result, rubberduck_details = self.agent.static_check(code, context)
-        result["rubberduck"] = {
-            "result": rubberduck_result,
-            "details": rubberduck_details,
+        if generated_vis:
+            display_names["vis"] = "Visualization check"
+        elif error or output:
+            display_names["sanity"] = "Output sanity check"
+
+        loading = "<span class='loader'></span>"
+        message_template = "<details><summary><b>{}:</b> {}</summary>\n{}</details>"
+
+        # Display the style and a loading row per check once.
+        # Afterwards, only the row of a finished check is updated.
+        display(HTML(VERIFY_STYLE))
+        handles = {
+            name: display(
+                HTML(message_template.format(title, loading, "Still loading...")),
+                display_id=True,
+            )
+            for name, title in display_names.items()
         }
-        display_statuses(result)
 
-        if generated_vis:
-            # verify generated visualization
-            # Roughly judge the source of the visualization
-            if "plt.show()" in code:
-                vis_framework = "matplotlib"
-                (
-                    visualization_check_result,
-                    visualization_check_details,
-                ) = self.agent.visualization_check(
-                    context["request"],
-                    "\n".join(context["codes"]),
-                    output.replace("<image/svg+xml>", ""),
-                    context["variables"],
-                    vis_framework,
+        def display_status(name, status):
+            handles[name].update(
+                HTML(
+                    message_template.format(
+                        display_names[name],
+                        VERIFY_STATUS_ICON[status["result"]],
+                        _details_to_html(status["details"]),
+                    )
                 )
-                details = ""
-                for detail in visualization_check_details:
-                    details += VERIFY_STATUS_ICON[detail[0]] + " " + detail[1] + "\n"
-                result["vis"] = {
-                    "result": visualization_check_result,
-                    "details": details,
-                }
-                display_statuses(result)
+            )
 
-        elif error or output:
-            sanity_result, sanity_details = self.agent.output_sanity_check(
-                code, context, error, output
+        run_coroutine(
+            self._averify(
+                code,
+                context,
+                self._get_joined_code_context(),
+                error,
+                output,
+                generated_vis,
+                display_status,
             )
-            result["sanity"] = {
-                "result": sanity_result,
-                "details": sanity_details,
-            }
-            display_statuses(result)
+        )
 
     @no_var_expand
     @cell_magic
@@ -369,44 +655,28 @@ class CoMLMagics(Magics):
                     "plt.show()",
                     "show_svg(plt)",
                 )
-                import inspect
-
                 from .vis_utils import show_svg
 
-                self.shell.run_cell(inspect.getsource(show_svg))
+                # Bind the function directly rather than re-running its source.
+                self.shell.user_ns["show_svg"] = show_svg
             output = self.shell.run_cell(cell)
             return output.result
         finally:
+            import ipywidgets as widgets
 
-            def like_button_on_click(b):
-                print("Thanks for your feedback! 🤗")
-
-            def fix_button_on_click(b):
-                run_code_in_next_cell(r"%comlfix")
-
-            def fix_with_comment_button_on_click(b):
-                insert_cell_below(r"%comlfix <describe the problem here>")
-
-            def verify_button_on_click(b):
-                run_code_in_next_cell("%comlverify")
-
-            like_button = widgets.Button(
-                description="🤗 Looks good!", layout=widgets.Layout(width="24.5%")
-            )
-            retry_button = widgets.Button(
-                description="🤬 Try again!", layout=widgets.Layout(width="24.5%")
-            )
+            layout = _get_button_layout()
+            like_button = widgets.Button(description="🤗 Looks good!", layout=layout)
+            retry_button = widgets.Button(description="🤬 Try again!", layout=layout)
             comment_button = widgets.Button(
-                description="🤯 I'll show you what's wrong.",
-                layout=widgets.Layout(width="24.5%"),
+                description="🤯 I'll show you what's wrong.", layout=layout
             )
             verify_button = widgets.Button(
-                description="🔍 Check yourself.", layout=widgets.Layout(width="24.5%")
+                description="🔍 Check yourself.", layout=layout
             )
-            like_button.on_click(like_button_on_click)
-            retry_button.on_click(fix_button_on_click)
-            comment_button.on_click(fix_with_comment_button_on_click)
-            verify_button.on_click(verify_button_on_click)
+            like_button.on_click(self._on_like_click)
+            retry_button.on_click(self._on_retry_click)
+            comment_button.on_click(self._on_comment_click)
+            verify_button.on_click(self._on_verify_click)
 
             combined = widgets.HBox(
                 [like_button, retry_button, comment_button, verify_button]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import re
+import warnings
+
+
+def parse_keep_alive(value: str) -> int | str:
+    """Ollama takes ``keep_alive`` either as seconds (e.g., ``-1`` to keep the
+    model loaded forever) or as a duration string (e.g., ``30m``)."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def warn_unquantized_model(model: str | None) -> None:
+    """Warn if the model tag points to 16-bit or 8-bit weights.
+
+    Decoding is memory-bandwidth bound, so 4-bit weights (e.g., ``q4_K_M``)
+    generate several times faster. The model is never rewritten, because
+    quantized tag names differ between models (e.g., ``8b-instruct-q4_K_M``).
+    Untagged models resolve to ``latest``, which is usually 4-bit already.
+    """
+    if model is None or ":" not in model:
+        return
+    tag = model.split(":", 1)[1]
+    if re.search(r"(^|-)(fp16|f16|bf16|fp32|f32|q8_0)$", tag, re.IGNORECASE):
+        warnings.warn(
+            f"Model {model} is not 4-bit quantized. Responses will be much slower "
+            "than with a q4_K_M variant of the same model."
+        )
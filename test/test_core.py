@@ -0,0 +1,78 @@
+import asyncio
+
+from langchain.schema import AIMessage
+
+from coml.core import CoMLAgent, parse_partial_code
+from coml.prompt_utils import GenerateContext
+
+
+def test_parse_partial_code():
+    assert parse_partial_code("") == ""
+    assert parse_partial_code("Let me think step by step.") == ""
+    assert parse_partial_code("Here it is:\n```python") == ""
+    assert parse_partial_code("Here it is:\n```python\n") == ""
+    assert parse_partial_code("Here it is:\n```python\nimport pa") == "import pa"
+    assert (
+        parse_partial_code("```python\nimport pandas as pd\ndf.hea")
+        == "import pandas as pd\ndf.hea"
+    )
+    assert parse_partial_code("```python\ndf.head()\n```\nDone.") == "df.head()"
+    assert parse_partial_code("```python\na\n``") == "a"
+    assert parse_partial_code("```python\na\n`") == "a"
+
+
+class FakeBatchLLM:
+    """Answers every prompt in a batch with the next canned response."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.batches = []
+
+    async def abatch(self, batch, return_exceptions=False):
+        self.batches.append(batch)
+        results = []
+        for response in self.responses[: len(batch)]:
+            if isinstance(response, Exception):
+                if not return_exceptions:
+                    raise response
+                results.append(response)
+            else:
+                results.append(AIMessage(content=response))
+        return results
+
+
+CONTEXT = GenerateContext(
+    variables={}, codes=[], request="Show the first rows of df.", answer="df.head()"
+)
+
+
+def test_batch_check():
+    llm = FakeBatchLLM(["Looks fine.\nCORRECT", "Output is empty.\nINCORRECT"])
+    agent = CoMLAgent(llm)
+    static, sanity = asyncio.run(
+        agent.batch_check("df.head()", CONTEXT, None, "   a\n0  1")
+    )
+    assert static == (True, "Looks fine.")
+    assert sanity == (False, "Output is empty.")
+    assert len(llm.batches) == 1 and len(llm.batches[0]) == 2
+    assert "Output of the code" in llm.batches[0][1][-1].content
+
+
+def test_batch_check_without_output():
+    llm = FakeBatchLLM(["I am not sure.\nMaybe"])
+    agent = CoMLAgent(llm)
+    static, sanity = asyncio.run(agent.batch_check("df.head()", CONTEXT))
+    assert static == (None, "I am not sure.\nMaybe")
+    assert sanity is None
+    assert len(llm.batches[0]) == 1
+
+
+def test_batch_check_with_failure():
+    error = ConnectionError("Connection reset by peer")
+    llm = FakeBatchLLM(["Looks fine.\nCORRECT", error])
+    agent = CoMLAgent(llm)
+    static, sanity = asyncio.run(
+        agent.batch_check("df.head()", CONTEXT, None, "   a\n0  1")
+    )
+    assert static == (True, "Looks fine.")
+    assert sanity is error
@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from coml.magics import (
+    VERIFY_STATUS_ICON,
+    CoMLMagics,
+    VerifyStatus,
+    _details_to_html,
+    _verify_status,
+)
+from coml.prompt_utils import GenerateContext
+
+
+def test_verify_status():
+    assert _verify_status("ok") is VerifyStatus.OK
+    assert _verify_status("warning") is VerifyStatus.WARNING
+    assert _verify_status("error") is VerifyStatus.ERROR
+    assert _verify_status("info") is VerifyStatus.INFO
+    assert _verify_status(True) is VerifyStatus.OK
+    assert _verify_status(False) is VerifyStatus.ERROR
+    assert _verify_status(None) is VerifyStatus.UNKNOWN
+
+
+def test_verify_status_icon():
+    assert len(VERIFY_STATUS_ICON) == len(VerifyStatus)
+    assert VERIFY_STATUS_ICON[VerifyStatus.OK] == "✅"
+    assert VERIFY_STATUS_ICON[VerifyStatus.ERROR] == "❌"
+    assert VERIFY_STATUS_ICON[VerifyStatus.UNKNOWN] == "❔"
+
+
+def test_details_to_html_plain():
+    details = "3:0: W0611: Unused import os (unused-import)\nUse `x < 1` instead."
+    assert _details_to_html(details) == (
+        "3:0: W0611: Unused import os (unused-import)<br />\n"
+        "Use <code>x &lt; 1</code> instead."
+    )
+
+
+def test_details_to_html_markdown():
+    html = _details_to_html("Issues:\n\n- first\n- second")
+    assert "<li>first</li>" in html
+    assert "<li>second</li>" in html
+
+    assert "<strong>wrong</strong>" in _details_to_html("This is **wrong**.")
+
+
+CODE = "x = 1\nprint(x)\n"
+
+CONTEXT = GenerateContext(
+    variables={}, codes=[], request="Print one.", answer="x = 1\nprint(x)"
+)
+
+
+class FakeAgent:
+    """Answers the checks with canned results and records the calls."""
+
+    def __init__(
+        self,
+        rubberduck=(True, "Looks fine."),
+        sanity=(True, "Output ok."),
+        static_error=None,
+    ):
+        self.rubberduck = rubberduck
+        self.sanity = sanity
+        self.static_error = static_error
+        self.calls = []
+
+    async def batch_check(self, code, context, error=None, output=None):
+        self.calls.append("batch_check")
+        return self.rubberduck, (self.sanity if error or output else None)
+
+    async def astatic_check(self, code, context):
+        self.calls.append("astatic_check")
+        if self.static_error is not None:
+            raise self.static_error
+        return self.rubberduck
+
+    async def aoutput_sanity_check(self, code, context, error=None, output=None):
+        self.calls.append("aoutput_sanity_check")
+        return self.sanity
+
+
+def make_magics(agent):
+    magics = CoMLMagics.__new__(CoMLMagics)
+    magics.agent = agent
+    magics._prefetched_static_check = None
+    return magics
+
+
+async def averify(magics, updates):
+    return await magics._averify(
+        CODE,
+        CONTEXT,
+        "",
+        None,
+        "1",
+        False,
+        lambda name, status: updates.append((name, status)),
+    )
+
+
+def test_averify():
+    updates = []
+    result = asyncio.run(averify(make_magics(FakeAgent()), updates))
+    assert set(result) == {"lint", "rubberduck", "sanity"}
+    assert result["rubberduck"] == {
+        "result": VerifyStatus.OK,
+        "details": "Looks fine.",
+    }
+    assert result["sanity"]["result"] is VerifyStatus.OK
+    assert result["lint"]["result"] is VerifyStatus.OK
+    assert sorted(name for name, _ in updates) == ["lint", "rubberduck", "sanity"]
+
+
+def test_averify_with_failure():
+    updates = []
+    agent = FakeAgent(sanity=ConnectionError("Connection reset by peer"))
+    with pytest.raises(ConnectionError):
+        asyncio.run(averify(make_magics(agent), updates))
+    statuses = dict(updates)
+    assert {name: status["result"] for name, status in statuses.items()} == {
+        "lint": VerifyStatus.OK,
+        "rubberduck": VerifyStatus.OK,
+        "sanity": VerifyStatus.ERROR,
+    }
+    assert statuses["rubberduck"]["details"] == "Looks fine."
+    assert statuses["sanity"]["details"] == (
+        "The check failed: ConnectionError: Connection reset by peer"
+    )
+
+
+def run_prefetched(agent, prefetched_code):
+    magics = make_magics(agent)
+
+    async def main():
+        magics._prefetch_static_check(prefetched_code, CONTEXT)
+        return await averify(magics, [])
+
+    return asyncio.run(main())
+
+
+def test_averify_with_prefetch():
+    agent = FakeAgent()
+    result = run_prefetched(agent, CODE)
+    assert agent.calls == ["astatic_check", "aoutput_sanity_check"]
+    assert result["rubberduck"]["details"] == "Looks fine."
+    assert result["sanity"]["result"] is VerifyStatus.OK
+
+
+def test_averify_with_failed_prefetch():
+    agent = FakeAgent(static_error=ConnectionError("Connection reset by peer"))
+    result = run_prefetched(agent, CODE)
+    assert agent.calls == ["astatic_check", "batch_check"]
+    assert result["rubberduck"]["result"] is VerifyStatus.OK
+
+
+def test_averify_with_prefetch_for_other_code():
+    agent = FakeAgent()
+    run_prefetched(agent, "y = 2\n")
+    assert "batch_check" in agent.calls
+    assert "aoutput_sanity_check" not in agent.calls
+
+
+def test_prefetch_cancels_previous():
+    magics = make_magics(FakeAgent())
+
+    async def main():
+        magics._prefetch_static_check("y = 2\n", CONTEXT)
+        previous = magics._prefetched_static_check[1]
+        magics._prefetch_static_check(CODE, CONTEXT)
+        current = magics._prefetched_static_check[1]
+        await asyncio.wait([previous, current])
+        return previous, current
+
+    previous, current = asyncio.run(main())
+    assert previous.cancelled()
+    assert current.result() == (True, "Looks fine.")
+    assert magics._prefetched_static_check[0] == CODE
@@ -0,0 +1,24 @@
+import warnings
+
+import pytest
+
+from coml.ollama import parse_keep_alive, warn_unquantized_model
+
+
+def test_parse_keep_alive():
+    assert parse_keep_alive("-1") == -1
+    assert parse_keep_alive("0") == 0
+    assert parse_keep_alive("300") == 300
+    assert parse_keep_alive("30m") == "30m"
+    assert parse_keep_alive("1h30m") == "1h30m"
+
+
+def test_warn_unquantized_model():
+    for model in ["llama3:8b-instruct-fp16", "llama3:70b-instruct-q8_0", "x:F16"]:
+        with pytest.warns(UserWarning, match="not 4-bit quantized"):
+            warn_unquantized_model(model)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for model in [None, "llama3", "llama3:70b", "llama3:8b-instruct-q4_K_M"]:
+            warn_unquantized_model(model)